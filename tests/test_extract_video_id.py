@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+from app import extract_video_id
+
+
+def test_video_path_takes_priority_over_short_form():
+    # A numeric "v/<digits>" earlier in the path must not shadow /video/<id>
+    assert extract_video_id("https://www.tiktok.com/@dev/1234/video/5678") == "5678"
+
+
+def test_canonical_video_url():
+    url = "https://www.tiktok.com/@user/video/7234567890123456789?lang=en"
+    assert extract_video_id(url) == "7234567890123456789"
+
+
+def test_short_form_video_url():
+    assert extract_video_id("https://m.tiktok.com/v/7234567890123456789.html") == "7234567890123456789"